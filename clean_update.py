@@ -4,14 +4,80 @@ Clean update mechanism for MaLDReTH tool deployments
 Usage: python3 clean_update.py
 """
 import sys
+from itertools import groupby
+from operator import itemgetter
 sys.path.append('.')
 
+from sqlalchemy import and_, case, func, select, text
 from streamlined_app import app, MaldrethStage, ToolCategory, ExemplarTool, db
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Unique (stage_id, lower(trim(name))) index on tool_categories; once it exists
+# duplicate categories can no longer be inserted and the merge pass is skipped
+CATEGORY_NAME_INDEX = 'uq_tool_categories_stage_lower_name'
+
+# Postgres advisory lock key serializing concurrent clean_update runs
+CLEAN_UPDATE_LOCK_KEY = 0x4D414C44  # 'MALD'
+
+def category_name_index_exists():
+    """Return True if the unique category name index has already been created."""
+    if db.engine.dialect.name == 'postgresql':
+        probe = "SELECT 1 FROM pg_indexes WHERE indexname = :name"
+    else:
+        probe = "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = :name"
+    return db.session.execute(text(probe), {'name': CATEGORY_NAME_INDEX}).scalar() is not None
+
+def merge_duplicate_categories():
+    """Merge categories sharing a name within a stage into the oldest one."""
+    # Let the database find duplicate (stage, name) keys so only duplicate
+    # categories are fetched, ordered so each group is contiguous
+    name_key = func.lower(func.trim(ToolCategory.name))
+    duplicate_keys = (
+        select(ToolCategory.stage_id, name_key.label('name_key'))
+        .group_by(ToolCategory.stage_id, name_key)
+        .having(func.count() > 1)
+        .subquery()
+    )
+    duplicate_rows = db.session.execute(
+        select(ToolCategory.id, ToolCategory.stage_id, name_key, MaldrethStage.name)
+        .join(MaldrethStage, MaldrethStage.id == ToolCategory.stage_id)
+        .join(duplicate_keys, and_(duplicate_keys.c.stage_id == ToolCategory.stage_id,
+                                   duplicate_keys.c.name_key == name_key))
+        .order_by(ToolCategory.stage_id, name_key, ToolCategory.id)
+    ).all()
+
+    category_remap = {}  # duplicate category id -> keeper category id
+    merged = []  # (category name, stage name) per merged duplicate
+    for (stage_id, name), rows in groupby(duplicate_rows, key=itemgetter(1, 2)):
+        # Keep the first one, merge tools into it
+        keeper_id, _, _, stage_name = next(rows)
+        for duplicate_id, _, _, _ in rows:
+            category_remap[duplicate_id] = keeper_id
+            merged.append((name, stage_name))
+
+    # One summary line instead of a log write per merged category
+    if merged:
+        logger.info(f"Merged {len(merged)} duplicate categories")
+        if logger.isEnabledFor(logging.DEBUG):
+            for name, stage_name in merged:
+                logger.debug(f"Merged duplicate category '{name}' in stage {stage_name}")
+
+    if category_remap:
+        # Move tools from every duplicate to its keeper in one UPDATE
+        ExemplarTool.query.filter(ExemplarTool.category_id.in_(category_remap)).update(
+            {ExemplarTool.category_id: case(category_remap, value=ExemplarTool.category_id)},
+            synchronize_session=False
+        )
+
+        # Remove the now-empty duplicate categories in one DELETE; nothing is
+        # left for the tools cascade to act on, so skip per-object session.delete
+        ToolCategory.query.filter(ToolCategory.id.in_(category_remap)).delete(
+            synchronize_session=False
+        )
+
 def clean_update():
     """Perform a clean update of tool data."""
     with app.app_context():
@@ -28,50 +94,58 @@ def clean_update():
             logger.warning(f"Could not check table existence: {e}")
             return True
 
-        # 1. Mark all auto-created tools as inactive
-        auto_tools = ExemplarTool.query.filter_by(auto_created=True, is_active=True).all()
-        for tool in auto_tools:
-            tool.is_active = False
+        # Serialize concurrent runs (e.g. overlapping release phases); the lock is
+        # held until this transaction commits or rolls back
+        if db.engine.dialect.name == 'postgresql':
+            db.session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {'key': CLEAN_UPDATE_LOCK_KEY})
+
+        # Return early on an already clean database: no active auto-created tools,
+        # and category duplicates ruled out by the unique index
+        active_auto_tools = ExemplarTool.query.filter_by(auto_created=True, is_active=True)
+        has_active_auto_tools = db.session.query(active_auto_tools.exists()).scalar()
+        index_exists = category_name_index_exists()
+        if not has_active_auto_tools and index_exists:
+            logger.info("Nothing to clean, skipping clean update")
+            return True
 
-        logger.info(f"Deactivated {len(auto_tools)} auto-created tools")
+        # 1. Mark all auto-created tools as inactive in a single UPDATE
+        if has_active_auto_tools:
+            deactivated_count = active_auto_tools.update(
+                {ExemplarTool.is_active: False}, synchronize_session=False
+            )
+            logger.info(f"Deactivated {deactivated_count} auto-created tools")
         
-        # 2. Remove duplicate categories (same name in same stage)
-        stages = MaldrethStage.query.all()
-        for stage in stages:
-            categories = ToolCategory.query.filter_by(stage_id=stage.id).all()
-            name_groups = {}
-            
-            for cat in categories:
-                name_key = cat.name.lower().strip()
-                if name_key not in name_groups:
-                    name_groups[name_key] = []
-                name_groups[name_key].append(cat)
-            
-            for name, cat_list in name_groups.items():
-                if len(cat_list) > 1:
-                    # Keep the first one, merge tools into it
-                    keeper = cat_list[0]
-                    
-                    for duplicate_cat in cat_list[1:]:
-                        # Move tools to keeper category
-                        tools_in_dup = ExemplarTool.query.filter_by(category_id=duplicate_cat.id).all()
-                        for tool in tools_in_dup:
-                            tool.category_id = keeper.id
-                        
-                        # Remove duplicate category
-                        db.session.delete(duplicate_cat)
-                        logger.info(f"Merged duplicate category '{name}' in stage {stage.name}")
+        # 2. Remove duplicate categories (same name in same stage), unless the unique
+        # index created by an earlier run already rules them out
+        if index_exists:
+            logger.info("Category names already unique per stage, skipping duplicate merge")
+        else:
+            merge_duplicate_categories()
         
         # 3. Commit all changes
         try:
             db.session.commit()
-            logger.info("✅ Clean update completed successfully")
-            return True
         except Exception as e:
             db.session.rollback()
             logger.error(f"❌ Clean update failed: {e}")
             return False
 
+        # 4. Enforce unique category names per stage so later runs can skip the merge
+        if not index_exists:
+            try:
+                db.session.execute(text(
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS {CATEGORY_NAME_INDEX} "
+                    "ON tool_categories (stage_id, lower(trim(name)))"
+                ))
+                db.session.commit()
+                logger.info(f"Created unique index {CATEGORY_NAME_INDEX}")
+            except Exception as e:
+                db.session.rollback()
+                logger.warning(f"Could not create unique index {CATEGORY_NAME_INDEX}: {e}")
+
+        logger.info("✅ Clean update completed successfully")
+        return True
+
 if __name__ == "__main__":
     success = clean_update()
     sys.exit(0 if success else 1)
@@ -8,56 +8,70 @@ Edit this file to update definitions, examples, or FAQ without touching template
 VERIFICATION STATUS:
 - Lifecycle stage definitions: NEEDS VERIFICATION against RDA MaLDReTH II outputs
 - Official source: https://www.rd-alliance.org/groups/mapping-the-landscape-of-digital-research-tools-ii-maldreth-ii
+
+Update instructions and the verification checklist live in
+config/README_GLOSSARY_CONTENT.md.
 """
 
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class FAQItem:
+    """A single glossary FAQ entry (rendered as an accordion item)."""
+    id: str
+    question: str
+    answer: str  # May contain HTML
+    expanded: bool = False  # Show open by default
+
 # FAQ Items - Easy to add/edit/remove
-FAQ_ITEMS = [
-    {
-        'id': 'faq1',
-        'question': 'What is the difference between "API Integration" and "Web Service"?',
-        'answer': '''<strong>API Integration</strong> refers to modern RESTful or GraphQL APIs with programmatic access,
+FAQ_ITEMS = (
+    FAQItem(
+        id='faq1',
+        question='What is the difference between "API Integration" and "Web Service"?',
+        answer='''<strong>API Integration</strong> refers to modern RESTful or GraphQL APIs with programmatic access,
                      typically using JSON. <strong>Web Service</strong> is broader and includes older protocols like
                      SOAP, XML-RPC, or domain-specific protocols like OAI-PMH. If in doubt, "API Integration" is
                      usually the better choice for contemporary tools.''',
-        'expanded': True  # Show this one by default
-    },
-    {
-        'id': 'faq2',
-        'question': 'Can one interaction belong to multiple lifecycle stages?',
-        'answer': '''Currently, each interaction is assigned to one primary lifecycle stage. If an interaction
+        expanded=True  # Show this one by default
+    ),
+    FAQItem(
+        id='faq2',
+        question='Can one interaction belong to multiple lifecycle stages?',
+        answer='''Currently, each interaction is assigned to one primary lifecycle stage. If an interaction
                      genuinely supports multiple stages, choose the stage where it's most commonly used, and mention
                      the other stages in the description or examples field.''',
-        'expanded': False
-    },
-    {
-        'id': 'faq3',
-        'question': 'What if the tools I want to add aren\'t in PRISM yet?',
-        'answer': '''When you add an interaction via CSV upload, PRISM will automatically create any missing tools.
+        expanded=False
+    ),
+    FAQItem(
+        id='faq3',
+        question='What if the tools I want to add aren\'t in PRISM yet?',
+        answer='''When you add an interaction via CSV upload, PRISM will automatically create any missing tools.
                      For manual entry through the web form, please contact the MaLDReTH II working group to request
                      tool additions, or use the CSV bulk upload feature.''',
-        'expanded': False
-    },
-    {
-        'id': 'faq4',
-        'question': 'How is PRISM different from other tool catalogs?',
-        'answer': '''PRISM focuses specifically on <strong>interactions between tools</strong> rather than just
+        expanded=False
+    ),
+    FAQItem(
+        id='faq4',
+        question='How is PRISM different from other tool catalogs?',
+        answer='''PRISM focuses specifically on <strong>interactions between tools</strong> rather than just
                      cataloging individual tools. While many catalogs list research tools, PRISM maps how they
                      connect, integrate, and work together across the research data lifecycle. This makes it
                      uniquely valuable for understanding research infrastructure interoperability.''',
-        'expanded': False
-    },
-    {
-        'id': 'faq5',
-        'question': 'Can I edit or update an interaction I submitted?',
-        'answer': '''Yes! Every interaction has an "Edit" button on its detail page. You can update any field
+        expanded=False
+    ),
+    FAQItem(
+        id='faq5',
+        question='Can I edit or update an interaction I submitted?',
+        answer='''Yes! Every interaction has an "Edit" button on its detail page. You can update any field
                      to improve accuracy or add additional information. All edits help improve the quality of
                      PRISM's knowledge base.''',
-        'expanded': False
-    },
-    {
-        'id': 'faq6',
-        'question': 'Who maintains PRISM and how can I get involved?',
-        'answer': '''PRISM is maintained by the <a href="https://www.rd-alliance.org/groups/mapping-the-landscape-of-digital-research-tools-ii-maldreth-ii" target="_blank">
+        expanded=False
+    ),
+    FAQItem(
+        id='faq6',
+        question='Who maintains PRISM and how can I get involved?',
+        answer='''PRISM is maintained by the <a href="https://www.rd-alliance.org/groups/mapping-the-landscape-of-digital-research-tools-ii-maldreth-ii" target="_blank">
                      MaLDReTH II RDA Working Group</a>. You can get involved by:
                      <ul class="mt-2">
                          <li>Contributing interaction data through PRISM</li>
@@ -65,29 +79,9 @@ FAQ_ITEMS = [
                          <li>Participating in RDA plenary sessions</li>
                          <li>Providing feedback and suggestions</li>
                      </ul>''',
-        'expanded': False
-    }
-]
-
-# Instructions for updating FAQ
-FAQ_UPDATE_INSTRUCTIONS = """
-TO ADD A NEW FAQ:
-1. Add a new dictionary to FAQ_ITEMS list with:
-   - 'id': unique identifier (e.g., 'faq7')
-   - 'question': The question text
-   - 'answer': The answer (can include HTML)
-   - 'expanded': True (show by default) or False (collapsed)
-
-2. Restart Flask application
-
-EXAMPLE:
-{
-    'id': 'faq7',
-    'question': 'How do I cite PRISM?',
-    'answer': 'Please cite PRISM as: [Citation text here]',
-    'expanded': False
-}
-"""
+        expanded=False
+    )
+)
 
 # MaLDReTH Terminology Definitions
 # NOTE: These should be verified against official RDA MaLDReTH II outputs
@@ -152,38 +146,3 @@ MALDRETH_TERMINOLOGY = {
         'verified_date': '2025-10-02'
     }
 }
-
-# Verification checklist
-VERIFICATION_CHECKLIST = """
-CONTENT VERIFICATION CHECKLIST:
-================================
-
-HIGH PRIORITY - Needs Verification:
-- [ ] MaLDReTH acronym expansion
-- [ ] Research Data Lifecycle 12-stage model definition
-- [ ] Lifecycle stage names (CONCEPTUALISE, PLAN, FUND, etc.)
-- [ ] Lifecycle stage descriptions in streamlined_app.py
-
-MEDIUM PRIORITY - Should Review:
-- [ ] Interaction type definitions
-- [ ] Technical indicators for each interaction type
-- [ ] Common protocols/tools lists
-
-VERIFIED:
-- [x] PRISM acronym and definition
-- [x] Tool-related terminology (Exemplar Tool, Tool Category, Tool Interaction)
-- [x] GORC definition
-
-OFFICIAL SOURCES TO CHECK:
-1. RDA MaLDReTH II Working Group page: https://www.rd-alliance.org/groups/mapping-the-landscape-of-digital-research-tools-ii-maldreth-ii
-2. RDA outputs/deliverables: Check for published documents
-3. Meeting notes and presentations from MaLDReTH II sessions
-4. Contact co-chairs for official definitions if not publicly available
-
-TO MARK AS VERIFIED:
-1. Confirm definition matches official source
-2. Update 'verification_status' to 'VERIFIED'
-3. Add 'verified_date' (YYYY-MM-DD)
-4. Add 'verified_by' field with name/role
-5. Add 'source_url' if available
-"""
@@ -5,10 +5,9 @@ Provides tools for cleaning test data and managing database state
 """
 
 import os
+import re
 import sys
-from datetime import datetime
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import aliased
 
 # Add the app directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -20,6 +19,20 @@ except ImportError as e:
     print(f"❌ Error importing application: {e}")
     sys.exit(1)
 
+# Keywords that suggest an interaction was entered as test data, compiled once
+# into a single case-insensitive pattern so each field is scanned in one pass.
+TEST_INDICATORS = (
+    'test', 'testing', 'demo', 'example', 'sample', 'temp', 'temporary',
+    'debug', 'placeholder', 'lorem', 'ipsum', 'xxx', 'yyy', 'zzz',
+    'asdf', 'qwerty', 'foo', 'bar', 'baz'
+)
+TEST_INDICATOR_PATTERN = re.compile(
+    '|'.join(map(re.escape, TEST_INDICATORS)),
+    re.IGNORECASE
+)
+
+PRIORITY_OPTIONS = frozenset({'High', 'Medium', 'Low'})
+
 def get_database_stats():
     """Get current database statistics"""
     with app.app_context():
@@ -33,43 +46,54 @@ def get_database_stats():
 
 def identify_test_entries():
     """Identify entries that appear to be test data"""
-    test_indicators = [
-        'test', 'testing', 'demo', 'example', 'sample', 'temp', 'temporary',
-        'debug', 'placeholder', 'lorem', 'ipsum', 'xxx', 'yyy', 'zzz',
-        'asdf', 'qwerty', 'foo', 'bar', 'baz'
-    ]
-    
     with app.app_context():
-        # Check tool interactions
+        # Select only the scanned columns plus tool names, rather than full ORM
+        # objects whose source/target relationships would lazy-load per row
+        source_tool = aliased(ExemplarTool)
+        target_tool = aliased(ExemplarTool)
+        rows = db.session.query(
+            ToolInteraction.id,
+            ToolInteraction.description,
+            ToolInteraction.technical_details,
+            ToolInteraction.benefits,
+            ToolInteraction.challenges,
+            ToolInteraction.examples,
+            ToolInteraction.contact_person,
+            ToolInteraction.organization,
+            ToolInteraction.submitted_by,
+            source_tool.name.label('source_tool_name'),
+            target_tool.name.label('target_tool_name')
+        ).outerjoin(
+            source_tool, ToolInteraction.source_tool_id == source_tool.id
+        ).outerjoin(
+            target_tool, ToolInteraction.target_tool_id == target_tool.id
+        ).all()
+
         test_interactions = []
-        interactions = ToolInteraction.query.all()
-        
-        for interaction in interactions:
+        for row in rows:
             fields_to_check = [
-                interaction.description or '',
-                interaction.technical_details or '',
-                interaction.benefits or '',
-                interaction.challenges or '',
-                interaction.examples or '',
-                interaction.contact_person or '',
-                interaction.organization or '',
-                interaction.submitted_by or ''
+                row.description,
+                row.technical_details,
+                row.benefits,
+                row.challenges,
+                row.examples,
+                row.contact_person,
+                row.organization,
+                row.submitted_by
             ]
             
-            is_test = False
-            for field in fields_to_check:
-                field_lower = field.lower()
-                if any(indicator in field_lower for indicator in test_indicators):
-                    is_test = True
-                    break
+            is_test = any(
+                TEST_INDICATOR_PATTERN.search(field)
+                for field in fields_to_check if field
+            )
             
             if is_test:
                 test_interactions.append({
-                    'id': interaction.id,
-                    'source_tool': interaction.source_tool.name if interaction.source_tool else 'N/A',
-                    'target_tool': interaction.target_tool.name if interaction.target_tool else 'N/A',
-                    'description': interaction.description[:50] + '...' if interaction.description else 'N/A',
-                    'submitted_by': interaction.submitted_by or 'N/A'
+                    'id': row.id,
+                    'source_tool': row.source_tool_name or 'N/A',
+                    'target_tool': row.target_tool_name or 'N/A',
+                    'description': row.description[:50] + '...' if row.description else 'N/A',
+                    'submitted_by': row.submitted_by or 'N/A'
                 })
         
         return test_interactions
@@ -142,12 +166,11 @@ def remove_test_entries():
     
     if confirm == 'yes':
         with app.app_context():
-            removed_count = 0
-            for entry in test_entries:
-                interaction = ToolInteraction.query.get(entry['id'])
-                if interaction:
-                    db.session.delete(interaction)
-                    removed_count += 1
+            # One bulk DELETE instead of a SELECT and DELETE per interaction
+            test_ids = [entry['id'] for entry in test_entries]
+            removed_count = ToolInteraction.query.filter(
+                ToolInteraction.id.in_(test_ids)
+            ).delete(synchronize_session=False)
             
             try:
                 db.session.commit()
@@ -229,7 +252,7 @@ def update_priority_fields():
             print("Priority options: High, Medium, Low")
             priority = input("Set priority for all entries (High/Medium/Low): ").strip()
             
-            if priority in ['High', 'Medium', 'Low']:
+            if priority in PRIORITY_OPTIONS:
                 confirm = input(f"Set priority to '{priority}' for {len(interactions)} interactions? (yes/no): ").strip().lower()
                 
                 if confirm == 'yes':
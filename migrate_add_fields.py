@@ -9,18 +9,35 @@ This script adds:
 Run this before starting the Flask app with the updated models.
 """
 
+import argparse
 import sqlite3
 import sys
 
 DATABASE_PATH = 'instance/streamlined_maldreth.db'
+CONFIRM_RESPONSES = frozenset({'yes', 'y'})
+# Recorded in PRAGMA user_version once this migration has been applied
+SCHEMA_VERSION = 1
 
 def migrate_database():
     """Add new columns to existing tables."""
 
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
+        # Manage the transaction explicitly: the default sqlite3 mode autocommits each
+        # ALTER/CREATE/DROP separately, so a failure could leave a half-rebuilt schema
+        conn = sqlite3.connect(DATABASE_PATH, isolation_level=None)
         cursor = conn.cursor()
 
+        # Skip the column additions and table rebuild on an already-migrated database
+        schema_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if schema_version >= SCHEMA_VERSION:
+            print(f"Database already at schema version {schema_version}, nothing to migrate.")
+            conn.close()
+            return
+
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("BEGIN IMMEDIATE")
+
         print("Starting database migration...")
 
         # Add columns to exemplar_tools table
@@ -120,6 +137,7 @@ def migrate_database():
         cursor.execute("ALTER TABLE exemplar_tools_new RENAME TO exemplar_tools")
         print("   ✓ Renamed new table to exemplar_tools")
 
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         conn.commit()
         print("\n✅ Migration completed successfully!")
 
@@ -151,6 +169,11 @@ def migrate_database():
         sys.exit(1)
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Add new fields to the PRISM SQLite database.")
+    parser.add_argument('-y', '--yes', action='store_true',
+                        help="Run without the confirmation prompt (for scripts and CI)")
+    args = parser.parse_args()
+
     print("PRISM Database Migration")
     print("="*60)
     print(f"Database: {DATABASE_PATH}")
@@ -163,10 +186,11 @@ if __name__ == '__main__':
         print("Please ensure the database exists before running migration.")
         sys.exit(1)
 
-    # Confirm migration
-    response = input("\nProceed with migration? (yes/no): ")
-    if response.lower() not in ['yes', 'y']:
-        print("Migration cancelled.")
-        sys.exit(0)
+    # Confirm migration unless --yes was given
+    if not args.yes:
+        response = input("\nProceed with migration? (yes/no): ")
+        if response.lower() not in CONFIRM_RESPONSES:
+            print("Migration cancelled.")
+            sys.exit(0)
 
     migrate_database()
@@ -55,62 +55,12 @@ ESSENTIAL_FILES = [
     'demo_interactions.csv'
 ]
 
-def create_backup_directory():
-    """Create a backup directory for removed files"""
-    backup_dir = ROOT_DIR / 'archive_removed_files'
-    backup_dir.mkdir(exist_ok=True)
-    return backup_dir
-
-def cleanup_files():
-    """Remove unnecessary files and create cleaner repository structure"""
-    print("🧹 PRISM Repository Cleanup")
-    print("=" * 50)
-    
-    backup_dir = create_backup_directory()
-    removed_count = 0
-    
-    print("Removing debug and temporary files...")
-    for file_name in FILES_TO_REMOVE:
-        file_path = ROOT_DIR / file_name
-        if file_path.exists():
-            shutil.move(str(file_path), str(backup_dir / file_name))
-            print(f"  ✅ Moved {file_name} to archive")
-            removed_count += 1
-        else:
-            print(f"  ⚠️  {file_name} not found")
-    
-    print("\nConsolidating documentation files...")
-    for doc_name in DOCS_TO_REMOVE:
-        doc_path = ROOT_DIR / doc_name
-        if doc_path.exists():
-            shutil.move(str(doc_path), str(backup_dir / doc_name))
-            print(f"  ✅ Moved {doc_name} to archive")
-            removed_count += 1
-    
-    # Clean up any __pycache__ directories
-    print("\nCleaning Python cache files...")
-    for pycache in ROOT_DIR.rglob('__pycache__'):
-        if pycache.is_dir():
-            shutil.rmtree(pycache)
-            print(f"  ✅ Removed {pycache}")
-    
-    # Clean up any .pyc files
-    for pyc_file in ROOT_DIR.rglob('*.pyc'):
-        pyc_file.unlink()
-        print(f"  ✅ Removed {pyc_file}")
-    
-    print(f"\n🎉 Cleanup complete! Moved {removed_count} files to archive.")
-    print(f"Archive location: {backup_dir}")
-    
-    return backup_dir
+# Directories never descended into when scanning for cache files
+SKIP_SCAN_DIRS = frozenset({'.git', 'venv', '.venv', 'env', 'node_modules'})
 
-def create_docs_directory():
-    """Create organized docs directory"""
-    docs_dir = ROOT_DIR / 'docs'
-    docs_dir.mkdir(exist_ok=True)
-    
-    # Create essential documentation
-    (docs_dir / 'API.md').write_text("""# PRISM API Documentation
+# Generated documentation written by create_docs_directory(), keyed by filename
+GENERATED_DOCS = {
+    'API.md': """# PRISM API Documentation
 
 ## Overview
 PRISM provides RESTful API endpoints for accessing tool and interaction data.
@@ -131,9 +81,9 @@ PRISM provides RESTful API endpoints for accessing tool and interaction data.
 
 ## Authentication
 Most endpoints are public. Write operations may require authentication in future versions.
-""")
+""",
 
-    (docs_dir / 'DEPLOYMENT.md').write_text("""# PRISM Deployment Guide
+    'DEPLOYMENT.md': """# PRISM Deployment Guide
 
 ## Heroku Deployment
 
@@ -158,9 +108,9 @@ Most endpoints are public. Write operations may require authentication in future
 - `DATABASE_URL` - PostgreSQL connection string
 - `SECRET_KEY` - Flask secret key
 - `FLASK_ENV` - development or production
-""")
+""",
 
-    (docs_dir / 'CONTRIBUTING.md').write_text("""# Contributing to PRISM
+    'CONTRIBUTING.md': """# Contributing to PRISM
 
 ## Ways to Contribute
 
@@ -190,7 +140,90 @@ Most endpoints are public. Write operations may require authentication in future
 - Add docstrings to functions
 - Include unit tests for new features
 - Update documentation as needed
-""")
+""",
+}
+
+def create_backup_directory():
+    """Create a backup directory for removed files"""
+    backup_dir = ROOT_DIR / 'archive_removed_files'
+    backup_dir.mkdir(exist_ok=True)
+    return backup_dir
+
+def iter_python_cache_entries(root):
+    """
+    Yield (path, is_dir) for __pycache__ directories and .pyc files under root.
+
+    Walks the tree once with os.scandir, reusing each DirEntry's cached type
+    instead of stat-ing every path as Path.rglob does, and skips SKIP_SCAN_DIRS
+    (VCS metadata, virtualenvs, node_modules).
+    """
+    pending = [str(root)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name == '__pycache__':
+                        yield entry.path, True
+                    elif entry.name not in SKIP_SCAN_DIRS:
+                        pending.append(entry.path)
+                elif entry.name.endswith('.pyc') and entry.is_file(follow_symlinks=False):
+                    yield entry.path, False
+
+def cleanup_files():
+    """Remove unnecessary files and create cleaner repository structure"""
+    print("🧹 PRISM Repository Cleanup")
+    print("=" * 50)
+    
+    backup_dir = create_backup_directory()
+    removed_count = 0
+
+    # List the top level once rather than stat-ing each candidate path
+    with os.scandir(ROOT_DIR) as entries:
+        root_files = {entry.name for entry in entries if entry.is_file(follow_symlinks=False)}
+    
+    print("Removing debug and temporary files...")
+    for file_name in FILES_TO_REMOVE:
+        file_path = ROOT_DIR / file_name
+        if file_name in root_files:
+            shutil.move(str(file_path), str(backup_dir / file_name))
+            print(f"  ✅ Moved {file_name} to archive")
+            removed_count += 1
+        else:
+            print(f"  ⚠️  {file_name} not found")
+    
+    print("\nConsolidating documentation files...")
+    for doc_name in DOCS_TO_REMOVE:
+        doc_path = ROOT_DIR / doc_name
+        if doc_name in root_files:
+            shutil.move(str(doc_path), str(backup_dir / doc_name))
+            print(f"  ✅ Moved {doc_name} to archive")
+            removed_count += 1
+    
+    # Clean up any __pycache__ directories and stray .pyc files in one walk
+    # Every yielded path starts with the root, so slice it off rather than
+    # building Path objects for relative_to()
+    print("\nCleaning Python cache files...")
+    root_prefix_len = len(os.path.join(str(ROOT_DIR), ''))
+    for cache_path, is_dir in iter_python_cache_entries(ROOT_DIR):
+        if is_dir:
+            shutil.rmtree(cache_path)
+        else:
+            os.remove(cache_path)
+        print(f"  ✅ Removed {cache_path[root_prefix_len:]}")
+    
+    print(f"\n🎉 Cleanup complete! Moved {removed_count} files to archive.")
+    print(f"Archive location: {backup_dir}")
+    
+    return backup_dir
+
+def create_docs_directory():
+    """Create organized docs directory"""
+    docs_dir = ROOT_DIR / 'docs'
+    docs_dir.mkdir(exist_ok=True)
+    
+    # Create essential documentation
+    for file_name, content in GENERATED_DOCS.items():
+        (docs_dir / file_name).write_text(content)
 
     print(f"✅ Created organized docs directory: {docs_dir}")
 
@@ -14,20 +14,29 @@ PRISM provides:
 """
 
 import os
+import re
 import csv
 import logging
 import math
+from collections import namedtuple
+from functools import lru_cache
+from itertools import islice
 from io import StringIO
-from flask import Flask, render_template, request, jsonify, flash, redirect, url_for, make_response
+from flask import (Flask, Response, render_template, request, jsonify, flash, redirect, url_for,
+                   make_response, stream_with_context)
 from flask_cors import CORS
+from jinja2 import FileSystemBytecodeCache
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
-from sqlalchemy import func
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import joinedload
 from datetime import datetime
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from .env for local development; production (Heroku)
+# injects config vars directly and ships no .env file
+if os.environ.get('FLASK_ENV') != 'production':
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # Import editable glossary content
 try:
@@ -41,7 +50,7 @@ except ImportError:
     logging.warning("Glossary config not found, using hardcoded values")
 
 # PRISM Configuration Constants
-INTERACTION_TYPES = [
+INTERACTION_TYPES = (
     'API Integration',
     'Data Exchange',
     'Metadata Exchange', 
@@ -53,9 +62,10 @@ INTERACTION_TYPES = [
     'Command Line Interface',
     'Import/Export',
     'Other'
-]
+)
+INTERACTION_TYPE_SET = frozenset(INTERACTION_TYPES)
 
-LIFECYCLE_STAGES = [
+LIFECYCLE_STAGES = (
     'CONCEPTUALISE',
     'PLAN',
     'FUND',
@@ -68,7 +78,7 @@ LIFECYCLE_STAGES = [
     'SHARE',
     'ACCESS',
     'TRANSFORM'
-]
+)
 
 # Interaction Type Definitions with examples and guidance
 INTERACTION_TYPE_DEFINITIONS = {
@@ -268,22 +278,157 @@ LIFECYCLE_STAGE_DEFINITIONS = {
     }
 }
 
+# Palette cycled across lifecycle stages in the RDL visualization
+STAGE_COLORS = (
+    '#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD',
+    '#98D8C8', '#F7DC6F', '#BB8FCE', '#85C1E9', '#F8C471', '#82E0AA'
+)
+
+# Contact-address pattern (use with fullmatch): no nested quantifiers, TLD length bounded
+EMAIL_PATTERN = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,63}')
+
+# CSV column layout shared by the interaction export and upload template
+INTERACTION_CSV_COLUMNS = (
+    'ID', 'Source Tool', 'Target Tool', 'Interaction Type', 'Lifecycle Stage',
+    'Description', 'Technical Details', 'Benefits', 'Challenges', 'Examples',
+    'Contact Person', 'Organization', 'Email', 'Priority', 'Complexity',
+    'Status', 'Submitted By', 'Submitted At'
+)
+
+INTERACTION_CSV_TOOL_COLUMNS = (
+    'Source Tool Open Source', 'Target Tool Open Source',
+    'Source Tool URL', 'Target Tool URL'
+)
+
+# CSV exports are streamed: rows fetched per query batch, bytes flushed per chunk
+CSV_EXPORT_BATCH_SIZE = 500
+CSV_STREAM_CHUNK_SIZE = 64 * 1024
+
+INTERACTION_CSV_REQUIRED_FIELDS = ('Source Tool', 'Target Tool', 'Interaction Type', 'Lifecycle Stage')
+INTERACTION_CSV_TEMPLATE_FIELDS = INTERACTION_CSV_COLUMNS[1:-1]
+
+# Example rows included in the downloadable CSV upload template
+INTERACTION_CSV_TEMPLATE_ROWS = (
+    {
+        'Source Tool': 'GitHub',
+        'Target Tool': 'Zenodo',
+        'Interaction Type': 'Data Exchange',
+        'Lifecycle Stage': 'PRESERVE',
+        'Description': 'GitHub repositories can be automatically archived to Zenodo with DOI assignment, creating permanent records of research software and datasets.',
+        'Technical Details': 'GitHub webhook integration, automatic metadata transfer via Zenodo API',
+        'Benefits': 'Permanent preservation, citable software versions with DOIs, enhanced reproducibility',
+        'Challenges': 'Large repository size limits, selective file archiving complexity, metadata mapping',
+        'Examples': 'Software packages automatically archived with each GitHub release; Research code preserved with version-specific DOIs',
+        'Contact Person': 'Your Name',
+        'Organization': 'Your Institution',
+        'Email': 'your.email@example.com',
+        'Priority': 'medium',
+        'Complexity': 'simple',
+        'Status': 'implemented',
+        'Submitted By': 'Template Example'
+    },
+    {
+        'Source Tool': 'REDCap',
+        'Target Tool': 'R',
+        'Interaction Type': 'API Integration',
+        'Lifecycle Stage': 'ANALYSE',
+        'Description': 'REDCap provides direct export capabilities to R for statistical analysis, streamlining the transition from data collection to analysis workflows.',
+        'Technical Details': 'REDCap API with R packages (REDCapR, redcapAPI), OAuth authentication, automated data synchronization',
+        'Benefits': 'Seamless data workflow, reduced manual errors, reproducible analysis pipelines, real-time data access',
+        'Challenges': 'Data format conversion complexity, access control management, API rate limits, authentication setup',
+        'Examples': 'Clinical trial data exported from REDCap for statistical analysis in R; Longitudinal study data automatically synced for ongoing analysis',
+        'Contact Person': '',
+        'Organization': '',
+        'Email': '',
+        'Priority': 'high',
+        'Complexity': 'moderate',
+        'Status': 'implemented',
+        'Submitted By': 'Template Example'
+    },
+    {
+        'Source Tool': 'Jupyter Notebook',
+        'Target Tool': 'Docker',
+        'Interaction Type': 'Workflow Integration',
+        'Lifecycle Stage': 'ANALYSE',
+        'Description': 'Jupyter notebooks can be containerized using Docker to ensure reproducible computational environments across different systems and platforms.',
+        'Technical Details': 'Docker containerization, Jupyter Docker stacks, environment specification via Dockerfile',
+        'Benefits': 'Reproducible environments, easy deployment, consistent dependencies across systems, version-controlled infrastructure',
+        'Challenges': 'Container size optimization, security considerations, learning curve for container technology',
+        'Examples': 'Data analysis notebooks packaged as Docker containers for reproducible research; Machine learning workflows containerized for deployment',
+        'Contact Person': '',
+        'Organization': '',
+        'Email': '',
+        'Priority': 'medium',
+        'Complexity': 'complex',
+        'Status': 'implemented',
+        'Submitted By': 'Template Example'
+    }
+)
+
+# Recognised values for the tools CSV "Is Open Source" column
+OPEN_SOURCE_CSV_VALUES = {'TRUE': True, 'FALSE': False}
+
+# File extensions accepted by the CSV upload routes (compared lower-cased)
+ALLOWED_UPLOAD_EXTENSIONS = frozenset({'csv'})
+
+# Tool names per IN (...) query when preloading the tools named in an uploaded CSV
+CSV_TOOL_LOOKUP_BATCH_SIZE = 500
+
+def normalize_database_url(url):
+    """Rewrite Heroku's legacy postgres:// scheme to the postgresql:// SQLAlchemy expects."""
+    if url.startswith('postgres://'):
+        return 'postgresql://' + url[len('postgres://'):]
+    return url
+
 # Initialize Flask app
 app = Flask(__name__)
 
 # Configuration
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
-app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///streamlined_maldreth.db')
+app.config['SQLALCHEMY_DATABASE_URI'] = normalize_database_url(
+    os.environ.get('DATABASE_URL', 'sqlite:///streamlined_maldreth.db')
+)
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# SQL statement logging is opt-in (SQLALCHEMY_ECHO=true) since it formats every query
+app.config['SQLALCHEMY_ECHO'] = os.environ.get('SQLALCHEMY_ECHO', '').lower() == 'true'
+# Reject oversized request bodies (form posts and CSV uploads) before they are parsed
+app.config['MAX_CONTENT_LENGTH'] = int(os.environ.get('MAX_CONTENT_LENGTH', 10 * 1024 * 1024))
+# Optional comma-separated allow-list for cross-origin requests, split once at
+# startup (Flask-CORS reads CORS_ORIGINS; unset keeps its allow-any default)
+if os.environ.get('CORS_ORIGINS'):
+    app.config['CORS_ORIGINS'] = tuple(
+        origin.strip() for origin in os.environ['CORS_ORIGINS'].split(',') if origin.strip()
+    )
+
+# Check pooled connections before handing them out and retire them before
+# server-side idle timeouts drop them
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_pre_ping': True,
+    'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+}
 
-if app.config['SQLALCHEMY_DATABASE_URI'].startswith('postgres://'):
-    app.config['SQLALCHEMY_DATABASE_URI'] = app.config['SQLALCHEMY_DATABASE_URI'].replace('postgres://', 'postgresql://')
+if app.config['SQLALCHEMY_DATABASE_URI'].startswith('postgresql'):
+    # Size the pool per worker (keep workers x (size + overflow) under the plan's
+    # connection limit); psycopg2: batch executemany UPDATE/DELETE too, and page
+    # multi-row INSERTs
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'].update({
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+        'pool_timeout': 30,
+        'executemany_mode': 'values_plus_batch',
+        'insertmanyvalues_page_size': 1000,
+    })
 
 # Initialize extensions
 db = SQLAlchemy(app)
 migrate = Migrate(app, db)
 CORS(app)
 
+# Optionally persist compiled templates so new worker processes skip Jinja compilation
+if os.environ.get('JINJA_BYTECODE_CACHE_DIR'):
+    os.makedirs(os.environ['JINJA_BYTECODE_CACHE_DIR'], exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(os.environ['JINJA_BYTECODE_CACHE_DIR'])
+
 # Add custom Jinja2 filters for trigonometric functions
 @app.template_filter('cos')
 def cos_filter(degrees):
@@ -299,11 +444,25 @@ def sin_filter(degrees):
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Punctuation and spaces ignored when comparing tool names
+# Punctuation and whitespace removed anywhere in a name. Removing spaces, tabs and line
+# breaks outright (rather than str.strip() vs SQL trim(), which only trims spaces)
+# keeps the Python and SQL normalizations identical.
+TOOL_NAME_DELETE_CHARS = '().-_ \t\r\n'
+TOOL_NAME_DELETE_TABLE = str.maketrans('', '', TOOL_NAME_DELETE_CHARS)
+
+def normalized_tool_name_expression(column):
+    """SQL counterpart of normalize_tool_name() for filtering on a name column."""
+    expression = func.lower(column)
+    for char in TOOL_NAME_DELETE_CHARS:
+        expression = func.replace(expression, char, '')
+    return expression
+
 def normalize_tool_name(name):
     """Normalize tool names for comparison and deduplication."""
     if not name:
         return ""
-    return name.lower().strip().replace('(', '').replace(')', '').replace('.', '').replace('-', '').replace('_', '').replace(' ', '')
+    return name.lower().translate(TOOL_NAME_DELETE_TABLE)
 
 
 
@@ -322,6 +481,10 @@ class MaldrethStage(db.Model):
 class ToolCategory(db.Model):
     """Model representing a category of tools within a stage."""
     __tablename__ = 'tool_categories'
+    __table_args__ = (
+        # Categories per stage (stage pages, seeding and category pickers)
+        db.Index('ix_tool_categories_stage_id', 'stage_id'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text)
@@ -331,6 +494,13 @@ class ToolCategory(db.Model):
 class ExemplarTool(db.Model):
     """Model representing exemplar tools within each category."""
     __tablename__ = 'exemplar_tools'
+    __table_args__ = (
+        # Tools per stage and per category, and reparenting when categories are merged
+        db.Index('ix_exemplar_tools_stage_id', 'stage_id'),
+        db.Index('ix_exemplar_tools_category_id', 'category_id'),
+        # Active auto-created tools (clean_update's existence probe and deactivation)
+        db.Index('ix_exemplar_tools_auto_created_is_active', 'auto_created', 'is_active'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text)
@@ -362,6 +532,14 @@ class ExemplarTool(db.Model):
 class ToolInteraction(db.Model):
     """Model representing interactions between tools, aligned with the Google Sheet fields."""
     __tablename__ = 'tool_interactions'
+    __table_args__ = (
+        # Tool lookups, duplicate checks and joins (the composite also serves source-only filters)
+        db.Index('ix_tool_interactions_source_target', 'source_tool_id', 'target_tool_id'),
+        db.Index('ix_tool_interactions_target_tool_id', 'target_tool_id'),
+        # Type filters and statistics, plus newest-first listings
+        db.Index('ix_tool_interactions_type', 'interaction_type'),
+        db.Index('ix_tool_interactions_submitted_at', 'submitted_at'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     source_tool_id = db.Column(db.Integer, db.ForeignKey('exemplar_tools.id'), nullable=False)
     target_tool_id = db.Column(db.Integer, db.ForeignKey('exemplar_tools.id'), nullable=False)
@@ -438,21 +616,131 @@ class Feedback(db.Model):
 
 # --- Helper Functions ---
 
+def validate_email_address(email, max_length):
+    """
+    Validate an optional email address submitted through a form.
+
+    The length check runs first so oversized input is rejected before the
+    format is matched against EMAIL_PATTERN.
+
+    Returns:
+        str: Error message to flash, or None if the value is acceptable
+    """
+    if not email:
+        return None
+    if len(email) > max_length:
+        return f'Email address must be {max_length} characters or fewer.'
+    if not EMAIL_PATTERN.fullmatch(email):
+        return 'Please enter a valid email address.'
+    return None
+
+def csv_cell(row, column):
+    """Return a stripped CSV cell, treating absent columns and short-row cells (None) as ''."""
+    return (row.get(column) or '').strip()
+
+def allowed_upload_file(filename):
+    """Return True if an uploaded filename has an extension in ALLOWED_UPLOAD_EXTENSIONS."""
+    _, dot, extension = filename.rpartition('.')
+    return bool(dot) and extension.lower() in ALLOWED_UPLOAD_EXTENSIONS
+
+
+def chunked(iterable, size):
+    """Yield successive lists of at most ``size`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def csv_stream_response(header, rows, filename):
+    """
+    Stream CSV rows to the client as they are produced instead of building the file in memory.
+
+    Args:
+        header: Column names for the first line
+        rows: Iterable of row value sequences, consumed lazily while the response is sent
+        filename: Download filename for the Content-Disposition header
+    """
+    def generate():
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(header)
+        for row in rows:
+            writer.writerow(row)
+            if buffer.tell() >= CSV_STREAM_CHUNK_SIZE:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    response = Response(stream_with_context(generate()), mimetype='text/csv')
+    response.headers['Content-Disposition'] = f'attachment; filename={filename}'
+    return response
+
+
+def iter_interactions_for_export():
+    """Yield all interactions in batches, with source and target tools loaded in the same query."""
+    return (
+        ToolInteraction.query
+        .options(joinedload(ToolInteraction.source_tool), joinedload(ToolInteraction.target_tool))
+        .order_by(ToolInteraction.id)
+        .yield_per(CSV_EXPORT_BATCH_SIZE)
+    )
+
+
+def interaction_csv_values(interaction):
+    """Return an interaction's values in INTERACTION_CSV_COLUMNS order."""
+    return [
+        interaction.id,
+        interaction.source_tool.name,
+        interaction.target_tool.name,
+        interaction.interaction_type,
+        interaction.lifecycle_stage,
+        interaction.description,
+        interaction.technical_details or '',
+        interaction.benefits or '',
+        interaction.challenges or '',
+        interaction.examples or '',
+        interaction.contact_person or '',
+        interaction.organization or '',
+        interaction.email or '',
+        interaction.priority or '',
+        interaction.complexity or '',
+        interaction.status or '',
+        interaction.submitted_by or '',
+        interaction.submitted_at.strftime('%Y-%m-%d %H:%M:%S') if interaction.submitted_at else ''
+    ]
+
+
+@lru_cache(maxsize=1)
+def build_csv_template():
+    """
+    Render the interaction upload template once; its content is static.
+
+    Returns:
+        str: CSV text with header and example rows
+    """
+    output = StringIO()
+    writer = csv.DictWriter(output, fieldnames=INTERACTION_CSV_TEMPLATE_FIELDS)
+    writer.writeheader()
+    writer.writerows(INTERACTION_CSV_TEMPLATE_ROWS)
+    return output.getvalue()
+
+
 def find_or_create_tool_from_csv(tool_name, import_source='CSV Import'):
     """Find existing tool by normalized name or create new one with deduplication."""
     try:
         # Normalize the tool name for comparison
         normalized_name = normalize_tool_name(tool_name)
         
-        # Look for existing tools with similar normalized names
-        existing_tools = ExemplarTool.query.filter(
-            func.lower(func.replace(func.replace(func.replace(ExemplarTool.name, ' ', ''), '-', ''), '.', '')) == normalized_name
-        ).all()
+        # Look for an existing tool whose name normalizes the same way, computed in SQL
+        # so only a match (not every candidate row) comes back
+        canonical_tool = ExemplarTool.query.filter(
+            normalized_tool_name_expression(ExemplarTool.name) == normalized_name
+        ).order_by(ExemplarTool.id).first()
         
-        if existing_tools:
-            # Return the first canonical tool
-            canonical_tool = existing_tools[0]
-            logger.info(f"Found existing tool for CSV import: {canonical_tool.name} (ID: {canonical_tool.id}) instead of creating '{tool_name}'")
+        if canonical_tool:
+            logger.debug("Found existing tool for CSV import: %s (ID: %s) instead of creating '%s'",
+                         canonical_tool.name, canonical_tool.id, tool_name)
             return canonical_tool, False  # Found existing
         
         # No existing tool found, create new one
@@ -501,7 +789,7 @@ def find_or_create_tool_from_csv(tool_name, import_source='CSV Import'):
         db.session.add(new_tool)
         db.session.flush()  # Get the ID without committing
         
-        logger.info(f"Auto-created new tool from CSV: {tool_name} (ID: {new_tool.id})")
+        logger.debug("Auto-created new tool from CSV: %s (ID: %s)", tool_name, new_tool.id)
         return new_tool, True  # Created new
         
     except Exception as e:
@@ -551,6 +839,12 @@ def add_interaction():
                 flash('Description is required.', 'danger')
                 return redirect(url_for('add_interaction'))
 
+            email_error = validate_email_address(request.form.get('email'),
+                                                 ToolInteraction.__table__.c.email.type.length)
+            if email_error:
+                flash(email_error, 'danger')
+                return redirect(url_for('add_interaction'))
+
             interaction = ToolInteraction(
                 source_tool_id=int(request.form.get('source_tool_id')),
                 target_tool_id=int(request.form.get('target_tool_id')),
@@ -628,6 +922,12 @@ def edit_interaction(interaction_id):
         interaction = ToolInteraction.query.get_or_404(interaction_id)
         
         if request.method == 'POST':
+            email_error = validate_email_address(request.form.get('email'),
+                                                 ToolInteraction.__table__.c.email.type.length)
+            if email_error:
+                flash(email_error, 'danger')
+                return redirect(url_for('edit_interaction', interaction_id=interaction_id))
+
             # Update interaction with form data
             interaction.source_tool_id = request.form.get('source_tool_id')
             interaction.target_tool_id = request.form.get('target_tool_id')
@@ -665,59 +965,18 @@ def edit_interaction(interaction_id):
 @app.route('/export/interactions/csv')
 def export_interactions_csv():
     """Export all interactions to CSV format."""
-    try:
-        interactions = ToolInteraction.query.all()
-        
-        # Create CSV content
-        output = StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([
-            'ID', 'Source Tool', 'Target Tool', 'Interaction Type', 'Lifecycle Stage',
-            'Description', 'Technical Details', 'Benefits', 'Challenges', 'Examples',
-            'Contact Person', 'Organization', 'Email', 'Priority', 'Complexity',
-            'Status', 'Submitted By', 'Submitted At', 'Source Tool Open Source',
-            'Target Tool Open Source', 'Source Tool URL', 'Target Tool URL'
-        ])
-        
-        # Write data rows
-        for interaction in interactions:
-            writer.writerow([
-                interaction.id,
-                interaction.source_tool.name,
-                interaction.target_tool.name,
-                interaction.interaction_type,
-                interaction.lifecycle_stage,
-                interaction.description,
-                interaction.technical_details or '',
-                interaction.benefits or '',
-                interaction.challenges or '',
-                interaction.examples or '',
-                interaction.contact_person or '',
-                interaction.organization or '',
-                interaction.email or '',
-                interaction.priority or '',
-                interaction.complexity or '',
-                interaction.status or '',
-                interaction.submitted_by or '',
-                interaction.submitted_at.strftime('%Y-%m-%d %H:%M:%S') if interaction.submitted_at else '',
-                'Yes' if interaction.source_tool.is_open_source else 'No',
-                'Yes' if interaction.target_tool.is_open_source else 'No',
-                interaction.source_tool.url or '',
-                interaction.target_tool.url or ''
-            ])
-        
-        # Create response
-        response = make_response(output.getvalue())
-        response.headers['Content-Type'] = 'text/csv'
-        response.headers['Content-Disposition'] = f'attachment; filename=prism_interactions_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-        
-        return response
-        
-    except Exception as e:
-        logger.error(f"Error exporting interactions to CSV: {e}")
-        return render_template('error.html', error=str(e)), 500
+    # Rows are queried lazily while the response streams, after the headers are sent
+    rows = (
+        interaction_csv_values(interaction) + [
+            'Yes' if interaction.source_tool.is_open_source else 'No',
+            'Yes' if interaction.target_tool.is_open_source else 'No',
+            interaction.source_tool.url or '',
+            interaction.target_tool.url or ''
+        ]
+        for interaction in iter_interactions_for_export()
+    )
+    filename = f'prism_interactions_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+    return csv_stream_response(INTERACTION_CSV_COLUMNS + INTERACTION_CSV_TOOL_COLUMNS, rows, filename)
 
 @app.route('/download/csv-template')
 def download_csv_template():
@@ -733,82 +992,7 @@ def download_csv_template():
         CSV file download response
     """
     try:
-        # Define template data with high-quality examples
-        template_data = [
-            {
-                'Source Tool': 'GitHub',
-                'Target Tool': 'Zenodo',
-                'Interaction Type': 'Data Exchange',
-                'Lifecycle Stage': 'PRESERVE',
-                'Description': 'GitHub repositories can be automatically archived to Zenodo with DOI assignment, creating permanent records of research software and datasets.',
-                'Technical Details': 'GitHub webhook integration, automatic metadata transfer via Zenodo API',
-                'Benefits': 'Permanent preservation, citable software versions with DOIs, enhanced reproducibility',
-                'Challenges': 'Large repository size limits, selective file archiving complexity, metadata mapping',
-                'Examples': 'Software packages automatically archived with each GitHub release; Research code preserved with version-specific DOIs',
-                'Contact Person': 'Your Name',
-                'Organization': 'Your Institution',
-                'Email': 'your.email@example.com',
-                'Priority': 'medium',
-                'Complexity': 'simple',
-                'Status': 'implemented',
-                'Submitted By': 'Template Example'
-            },
-            {
-                'Source Tool': 'REDCap',
-                'Target Tool': 'R',
-                'Interaction Type': 'API Integration',
-                'Lifecycle Stage': 'ANALYSE',
-                'Description': 'REDCap provides direct export capabilities to R for statistical analysis, streamlining the transition from data collection to analysis workflows.',
-                'Technical Details': 'REDCap API with R packages (REDCapR, redcapAPI), OAuth authentication, automated data synchronization',
-                'Benefits': 'Seamless data workflow, reduced manual errors, reproducible analysis pipelines, real-time data access',
-                'Challenges': 'Data format conversion complexity, access control management, API rate limits, authentication setup',
-                'Examples': 'Clinical trial data exported from REDCap for statistical analysis in R; Longitudinal study data automatically synced for ongoing analysis',
-                'Contact Person': '',
-                'Organization': '',
-                'Email': '',
-                'Priority': 'high',
-                'Complexity': 'moderate',
-                'Status': 'implemented',
-                'Submitted By': 'Template Example'
-            },
-            {
-                'Source Tool': 'Jupyter Notebook',
-                'Target Tool': 'Docker',
-                'Interaction Type': 'Workflow Integration',
-                'Lifecycle Stage': 'ANALYSE',
-                'Description': 'Jupyter notebooks can be containerized using Docker to ensure reproducible computational environments across different systems and platforms.',
-                'Technical Details': 'Docker containerization, Jupyter Docker stacks, environment specification via Dockerfile',
-                'Benefits': 'Reproducible environments, easy deployment, consistent dependencies across systems, version-controlled infrastructure',
-                'Challenges': 'Container size optimization, security considerations, learning curve for container technology',
-                'Examples': 'Data analysis notebooks packaged as Docker containers for reproducible research; Machine learning workflows containerized for deployment',
-                'Contact Person': '',
-                'Organization': '',
-                'Email': '',
-                'Priority': 'medium',
-                'Complexity': 'complex',
-                'Status': 'implemented',
-                'Submitted By': 'Template Example'
-            }
-        ]
-
-        # Create CSV in memory
-        output = StringIO()
-
-        # Define fieldnames matching database schema
-        fieldnames = [
-            'Source Tool', 'Target Tool', 'Interaction Type', 'Lifecycle Stage',
-            'Description', 'Technical Details', 'Benefits', 'Challenges', 'Examples',
-            'Contact Person', 'Organization', 'Email', 'Priority', 'Complexity',
-            'Status', 'Submitted By'
-        ]
-
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(template_data)
-
-        # Prepare response
-        csv_content = output.getvalue()
-        response = make_response(csv_content)
+        response = make_response(build_csv_template())
         response.headers['Content-Type'] = 'text/csv'
         response.headers['Content-Disposition'] = 'attachment; filename=prism_interaction_template.csv'
 
@@ -836,7 +1020,7 @@ def upload_interactions_csv():
             flash('No file selected. Please choose a CSV file to upload.', 'error')
             return redirect(request.url)
         
-        if not file.filename.lower().endswith('.csv'):
+        if not allowed_upload_file(file.filename):
             flash('Invalid file type. Please upload a CSV file.', 'error')
             return redirect(request.url)
         
@@ -865,18 +1049,22 @@ def upload_interactions_csv():
             )
             existing_signatures.add(signature)
         
+        # Tools resolved earlier in this upload, keyed by the name as written in the CSV
+        tool_cache = {}
+
         for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 to account for header
             try:
                 # Skip rows that are missing required fields
-                if not all([row.get('Source Tool'), row.get('Target Tool'), 
-                           row.get('Interaction Type'), row.get('Lifecycle Stage')]):
+                if not all(row.get(field) for field in INTERACTION_CSV_REQUIRED_FIELDS):
                     skipped_count += 1
                     errors.append(f"Row {row_num}: Missing required fields")
                     continue
                 
                 # Find source and target tools by name, create if not found
-                source_tool = ExemplarTool.query.filter_by(name=row['Source Tool']).first()
-                target_tool = ExemplarTool.query.filter_by(name=row['Target Tool']).first()
+                source_tool = (tool_cache.get(row['Source Tool'])
+                               or ExemplarTool.query.filter_by(name=row['Source Tool']).first())
+                target_tool = (tool_cache.get(row['Target Tool'])
+                               or ExemplarTool.query.filter_by(name=row['Target Tool']).first())
                 
                 if not source_tool:
                     try:
@@ -897,7 +1085,10 @@ def upload_interactions_csv():
                         error_count += 1
                         errors.append(f"Row {row_num}: Failed to create target tool '{row['Target Tool']}': {e}")
                         continue
-                
+
+                tool_cache[row['Source Tool']] = source_tool
+                tool_cache[row['Target Tool']] = target_tool
+
                 # Check for duplicates
                 signature = (
                     source_tool.id,
@@ -912,7 +1103,7 @@ def upload_interactions_csv():
                     continue
                 
                 # Validate interaction type
-                if row['Interaction Type'] not in INTERACTION_TYPES:
+                if row['Interaction Type'] not in INTERACTION_TYPE_SET:
                     error_count += 1
                     errors.append(f"Row {row_num}: Invalid interaction type '{row['Interaction Type']}'")
                     continue
@@ -951,6 +1142,8 @@ def upload_interactions_csv():
         # Commit all successful imports
         if imported_count > 0:
             db.session.commit()
+        logger.info("Interactions CSV import: %d imported, %d tools auto-created, %d skipped, %d errors",
+                    imported_count, created_tools_count, skipped_count, error_count)
         
         # Prepare summary message
         messages = []
@@ -1014,7 +1207,7 @@ def upload_tools_csv():
             flash('No file selected', 'error')
             return redirect(request.url)
 
-        if not file.filename.endswith('.csv'):
+        if not allowed_upload_file(file.filename):
             flash('File must be a CSV', 'error')
             return redirect(request.url)
 
@@ -1039,26 +1232,41 @@ def upload_tools_csv():
         errors = []
         updates_list = []
 
+        # Load every existing tool named in the file up front rather than querying
+        # per row; on duplicate names the lowest id wins, as with .first() before
+        rows = list(csv_reader)
+        csv_tool_names = {csv_cell(row, 'Tool Name') for row in rows} - {''}
+        tools_by_name = {}
+        for names in chunked(csv_tool_names, CSV_TOOL_LOOKUP_BATCH_SIZE):
+            for tool in ExemplarTool.query.filter(ExemplarTool.name.in_(names)).order_by(ExemplarTool.id):
+                tools_by_name.setdefault(tool.name, tool)
+
+        # New tools are collected here and inserted in one batch after the loop;
+        # they are also added to tools_by_name so a repeated row updates them instead
+        new_tools = []
+
         # Process each row
-        for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 (row 1 is header)
+        for row_num, row in enumerate(rows, start=2):  # Start at 2 (row 1 is header)
             try:
+                # Read every cell once; short rows leave missing cells as None
+                tool_name = csv_cell(row, 'Tool Name')
+                description = csv_cell(row, 'Description')
+                url = csv_cell(row, 'URL')
+                license_name = csv_cell(row, 'License')
+                github_url = csv_cell(row, 'GitHub URL')
+                notes = csv_cell(row, 'Notes')
+
                 # Validate required field
-                if not row.get('Tool Name', '').strip():
+                if not tool_name:
                     error_count += 1
                     errors.append(f"Row {row_num}: Tool Name is required")
                     continue
 
-                tool_name = row['Tool Name'].strip()
-
-                # Check if tool already exists
-                existing_tool = ExemplarTool.query.filter_by(name=tool_name).first()
+                # Check if tool already exists (or was created by an earlier row)
+                existing_tool = tools_by_name.get(tool_name)
 
                 # Parse Is Open Source
-                is_open_source = None
-                if row.get('Is Open Source', '').strip().upper() == 'TRUE':
-                    is_open_source = True
-                elif row.get('Is Open Source', '').strip().upper() == 'FALSE':
-                    is_open_source = False
+                is_open_source = OPEN_SOURCE_CSV_VALUES.get(csv_cell(row, 'Is Open Source').upper())
 
                 # Note: We don't create/update categories from CSV since they require stage_id
                 # Categories must be created through the normal UI which associates them with stages
@@ -1067,12 +1275,12 @@ def upload_tools_csv():
                     # Update existing tool with enriched data
                     updated = False
 
-                    if row.get('Description', '').strip() and not existing_tool.description:
-                        existing_tool.description = row['Description'].strip()
+                    if description and not existing_tool.description:
+                        existing_tool.description = description
                         updated = True
 
-                    if row.get('URL', '').strip() and not existing_tool.url:
-                        existing_tool.url = row['URL'].strip()
+                    if url and not existing_tool.url:
+                        existing_tool.url = url
                         updated = True
 
                     if is_open_source is not None:
@@ -1080,18 +1288,18 @@ def upload_tools_csv():
                         updated = True
 
                     # Update new enriched fields
-                    if row.get('License', '').strip() and not existing_tool.license:
-                        existing_tool.license = row['License'].strip()
+                    if license_name and not existing_tool.license:
+                        existing_tool.license = license_name
                         updated = True
 
-                    if row.get('GitHub URL', '').strip() and not existing_tool.github_url:
-                        existing_tool.github_url = row['GitHub URL'].strip()
+                    if github_url and not existing_tool.github_url:
+                        existing_tool.github_url = github_url
                         updated = True
 
-                    if row.get('Notes', '').strip():
+                    if notes:
                         # Append notes if they don't already exist
-                        if not existing_tool.notes or row['Notes'].strip() not in existing_tool.notes:
-                            existing_tool.notes = (existing_tool.notes or '') + '\n' + row['Notes'].strip()
+                        if not existing_tool.notes or notes not in existing_tool.notes:
+                            existing_tool.notes = (existing_tool.notes or '') + '\n' + notes
                             updated = True
 
                     if updated:
@@ -1104,12 +1312,12 @@ def upload_tools_csv():
                     # Now stage_id and category_id are nullable, so we can create tools from CSV
                     new_tool = ExemplarTool(
                         name=tool_name,
-                        description=row.get('Description', '').strip() or None,
-                        url=row.get('URL', '').strip() or None,
+                        description=description or None,
+                        url=url or None,
                         is_open_source=is_open_source,
-                        license=row.get('License', '').strip() or None,
-                        github_url=row.get('GitHub URL', '').strip() or None,
-                        notes=row.get('Notes', '').strip() or None,
+                        license=license_name or None,
+                        github_url=github_url or None,
+                        notes=notes or None,
                         stage_id=None,  # Will be set via UI later
                         category_id=None,  # Will be set via UI later
                         auto_created=True,  # Mark as auto-created
@@ -1117,7 +1325,8 @@ def upload_tools_csv():
                         import_source='Tool CSV Upload'
                     )
 
-                    db.session.add(new_tool)
+                    new_tools.append(new_tool)
+                    tools_by_name[tool_name] = new_tool
                     imported_count += 1
 
             except Exception as e:
@@ -1125,9 +1334,13 @@ def upload_tools_csv():
                 errors.append(f"Row {row_num}: {str(e)}")
                 continue
 
-        # Commit all successful imports/updates
+        # Insert all new tools in one batch, then commit all successful imports/updates
+        if new_tools:
+            db.session.bulk_save_objects(new_tools)
         if imported_count > 0 or updated_count > 0:
             db.session.commit()
+        logger.info("Tools CSV import: %d imported, %d updated, %d skipped, %d errors",
+                    imported_count, updated_count, skipped_count, error_count)
 
         # Prepare summary message
         messages = []
@@ -1171,6 +1384,12 @@ def feedback():
     """Collect user feedback on PRISM alpha."""
     if request.method == 'POST':
         try:
+            email_error = validate_email_address(request.form.get('contact_email'),
+                                                 Feedback.__table__.c.contact_email.type.length)
+            if email_error:
+                flash(email_error, 'danger')
+                return redirect(url_for('feedback'))
+
             # Collect feedback data
             new_feedback = Feedback(
                 category=request.form.get('category'),
@@ -1280,11 +1499,13 @@ def glossary():
         total_interactions = ToolInteraction.query.count()
         total_tools = ExemplarTool.query.count()
 
-        # Get interaction type usage statistics
-        interaction_type_stats = {}
-        for itype in INTERACTION_TYPES:
-            count = ToolInteraction.query.filter_by(interaction_type=itype).count()
-            interaction_type_stats[itype] = count
+        # Get interaction type usage statistics in a single grouped query
+        type_counts = dict(
+            db.session.query(ToolInteraction.interaction_type, func.count(ToolInteraction.id))
+            .group_by(ToolInteraction.interaction_type)
+            .all()
+        )
+        interaction_type_stats = {itype: type_counts.get(itype, 0) for itype in INTERACTION_TYPES}
 
         return render_template('glossary.html',
                              interaction_types=INTERACTION_TYPE_DEFINITIONS,
@@ -1516,11 +1737,6 @@ def enhanced_rdl_visualization():
         interaction_list = []
         
         # Enhanced stage data with colors and statistics
-        stage_colors = [
-            '#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD',
-            '#98D8C8', '#F7DC6F', '#BB8FCE', '#85C1E9', '#F8C471', '#82E0AA'
-        ]
-        
         for i, stage in enumerate(stages):
             stage_tools = [t for t in tools if t.stage_id == stage.id]
             
@@ -1529,7 +1745,7 @@ def enhanced_rdl_visualization():
                 'name': stage.name,
                 'description': stage.description or f"Stage {stage.position + 1} of the research data lifecycle",
                 'position': stage.position,
-                'color': stage_colors[i % len(stage_colors)],
+                'color': STAGE_COLORS[i % len(STAGE_COLORS)],
                 'tool_count': len(stage_tools),
                 'tools': [{'id': t.id, 'name': t.name, 'is_open_source': t.is_open_source} for t in stage_tools]
             }
@@ -2066,25 +2282,45 @@ def api_get_interactions():
 def api_get_statistics():
     """API endpoint to retrieve PRISM platform statistics."""
     try:
+        # Headline counts in a single round trip
+        active_tools = ExemplarTool.is_active.is_(True)
+        total_tools, total_interactions, total_stages, open_source_tools = db.session.execute(select(
+            select(func.count(ExemplarTool.id)).where(active_tools).scalar_subquery(),
+            select(func.count(ToolInteraction.id)).scalar_subquery(),
+            select(func.count(MaldrethStage.id)).scalar_subquery(),
+            select(func.count(ExemplarTool.id))
+            .where(active_tools, ExemplarTool.is_open_source.is_(True)).scalar_subquery()
+        )).one()
+
         stats = {
-            'total_tools': ExemplarTool.query.filter_by(is_active=True).count(),
-            'total_interactions': ToolInteraction.query.count(),
-            'total_stages': MaldrethStage.query.count(),
-            'open_source_tools': ExemplarTool.query.filter_by(is_active=True, is_open_source=True).count(),
+            'total_tools': total_tools,
+            'total_interactions': total_interactions,
+            'total_stages': total_stages,
+            'open_source_tools': open_source_tools,
             'interaction_types': {},
             'stage_distribution': {}
         }
         
         # Count interactions by type
+        type_counts = dict(
+            db.session.query(ToolInteraction.interaction_type, func.count(ToolInteraction.id))
+            .group_by(ToolInteraction.interaction_type)
+            .all()
+        )
         for interaction_type in INTERACTION_TYPES:
-            count = ToolInteraction.query.filter_by(interaction_type=interaction_type).count()
-            if count > 0:
-                stats['interaction_types'][interaction_type] = count
-        
-        # Count tools by stage
-        for stage in MaldrethStage.query.all():
-            tool_count = ExemplarTool.query.filter_by(stage_id=stage.id, is_active=True).count()
-            stats['stage_distribution'][stage.name] = tool_count
+            if type_counts.get(interaction_type):
+                stats['interaction_types'][interaction_type] = type_counts[interaction_type]
+        
+        # Count active tools by stage (stages without tools report 0)
+        stage_counts = (
+            db.session.query(MaldrethStage.name, func.count(ExemplarTool.id))
+            .outerjoin(ExemplarTool, and_(ExemplarTool.stage_id == MaldrethStage.id, active_tools))
+            .group_by(MaldrethStage.id, MaldrethStage.name)
+            .order_by(MaldrethStage.id)
+            .all()
+        )
+        for stage_name, tool_count in stage_counts:
+            stats['stage_distribution'][stage_name] = tool_count
         
         return jsonify({
             'success': True,
@@ -2097,60 +2333,39 @@ def api_get_statistics():
 @app.route('/export/csv')
 def export_csv():
     """Export all interactions to CSV format."""
-    try:
-        import csv
-        from io import StringIO
-        from flask import make_response
-        
-        output = StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([
-            'ID', 'Source Tool', 'Target Tool', 'Interaction Type', 'Lifecycle Stage',
-            'Description', 'Technical Details', 'Benefits', 'Challenges', 'Examples',
-            'Contact Person', 'Organization', 'Email', 'Priority', 'Complexity', 
-            'Status', 'Submitted By', 'Submitted At'
-        ])
-        
-        # Write data
-        interactions = ToolInteraction.query.all()
-        for interaction in interactions:
-            writer.writerow([
-                interaction.id,
-                interaction.source_tool.name,
-                interaction.target_tool.name,
-                interaction.interaction_type,
-                interaction.lifecycle_stage,
-                interaction.description,
-                interaction.technical_details or '',
-                interaction.benefits or '',
-                interaction.challenges or '',
-                interaction.examples or '',
-                interaction.contact_person or '',
-                interaction.organization or '',
-                interaction.email or '',
-                interaction.priority or '',
-                interaction.complexity or '',
-                interaction.status or '',
-                interaction.submitted_by or '',
-                interaction.submitted_at.strftime('%Y-%m-%d %H:%M:%S') if interaction.submitted_at else ''
-            ])
-        
-        output.seek(0)
-        response = make_response(output.getvalue())
-        response.headers['Content-Type'] = 'text/csv'
-        response.headers['Content-Disposition'] = 'attachment; filename=maldreth_interactions.csv'
-        return response
-        
-    except Exception as e:
-        logger.error(f"Error exporting CSV: {e}")
-        flash('Error exporting data. Please try again.', 'error')
-        return redirect(url_for('index'))
+    # Rows are queried lazily while the response streams, after the headers are sent
+    rows = (interaction_csv_values(interaction) for interaction in iter_interactions_for_export())
+    return csv_stream_response(INTERACTION_CSV_COLUMNS, rows, 'maldreth_interactions.csv')
 
 
 # --- Database Initialization ---
 
+# Columns added after the initial schema, as (table, ((column, DDL type), ...)).
+# migrate_database_schema() issues ALTER TABLE ... ADD COLUMN for any missing entry.
+SCHEMA_COLUMN_MIGRATIONS = (
+    ('exemplar_tools', (
+        ('provider', 'VARCHAR(200)'),
+        ('license', 'VARCHAR(100)'),
+        ('github_url', 'VARCHAR(500)'),
+        ('notes', 'TEXT'),
+        ('created_via', "VARCHAR(100) DEFAULT 'UI'"),
+        ('is_archived', 'BOOLEAN DEFAULT FALSE'),
+        ('auto_created', 'BOOLEAN DEFAULT FALSE'),
+        ('import_source', 'VARCHAR(100)'),
+        ('created_at', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP'),
+        ('updated_at', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP'),
+    )),
+    # Enhanced visualization fields
+    ('tool_interactions', (
+        ('priority', "VARCHAR(20) DEFAULT 'Medium'"),
+        ('complexity', "VARCHAR(20) DEFAULT 'Medium'"),
+        ('status', "VARCHAR(20) DEFAULT 'Active'"),
+        ('auto_created', 'BOOLEAN DEFAULT FALSE'),
+        ('is_archived', 'BOOLEAN DEFAULT FALSE'),
+    )),
+)
+
+
 def migrate_database_schema():
     """Safely migrate database schema to add new fields without data loss."""
     try:
@@ -2172,57 +2387,26 @@ def migrate_database_schema():
             Feedback.__table__.create(db.engine, checkfirst=True)
             logger.info("✅ Feedback table created successfully")
 
-        columns = [col['name'] for col in inspector.get_columns('exemplar_tools')]
-        
         migrations_needed = []
 
-        # Check for each new column and add SQL to create them
-        if 'provider' not in columns:
-            migrations_needed.append('ALTER TABLE exemplar_tools ADD COLUMN provider VARCHAR(200)')
-        if 'license' not in columns:
-            migrations_needed.append('ALTER TABLE exemplar_tools ADD COLUMN license VARCHAR(100)')
-        if 'github_url' not in columns:
-            migrations_needed.append('ALTER TABLE exemplar_tools ADD COLUMN github_url VARCHAR(500)')
-        if 'notes' not in columns:
-            migrations_needed.append('ALTER TABLE exemplar_tools ADD COLUMN notes TEXT')
-        if 'created_via' not in columns:
-            migrations_needed.append("ALTER TABLE exemplar_tools ADD COLUMN created_via VARCHAR(100) DEFAULT 'UI'")
-        if 'is_archived' not in columns:
-            migrations_needed.append('ALTER TABLE exemplar_tools ADD COLUMN is_archived BOOLEAN DEFAULT FALSE')
-        if 'auto_created' not in columns:
-            migrations_needed.append('ALTER TABLE exemplar_tools ADD COLUMN auto_created BOOLEAN DEFAULT FALSE')
-        if 'import_source' not in columns:
-            migrations_needed.append('ALTER TABLE exemplar_tools ADD COLUMN import_source VARCHAR(100)')
-        if 'created_at' not in columns:
-            migrations_needed.append('ALTER TABLE exemplar_tools ADD COLUMN created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP')
-        if 'updated_at' not in columns:
-            migrations_needed.append('ALTER TABLE exemplar_tools ADD COLUMN updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP')
-        
-        # Check tool_interactions table for enhanced visualization fields
-        try:
-            interaction_columns = [col['name'] for col in inspector.get_columns('tool_interactions')]
-            if 'priority' not in interaction_columns:
-                migrations_needed.append("ALTER TABLE tool_interactions ADD COLUMN priority VARCHAR(20) DEFAULT 'Medium'")
-            if 'complexity' not in interaction_columns:
-                migrations_needed.append("ALTER TABLE tool_interactions ADD COLUMN complexity VARCHAR(20) DEFAULT 'Medium'")
-            if 'status' not in interaction_columns:
-                migrations_needed.append("ALTER TABLE tool_interactions ADD COLUMN status VARCHAR(20) DEFAULT 'Active'")
-            if 'auto_created' not in interaction_columns:
-                migrations_needed.append("ALTER TABLE tool_interactions ADD COLUMN auto_created BOOLEAN DEFAULT FALSE")
-            if 'is_archived' not in interaction_columns:
-                migrations_needed.append("ALTER TABLE tool_interactions ADD COLUMN is_archived BOOLEAN DEFAULT FALSE")
-
-            # Nov 13, 2025 Co-chairs meeting: Make lifecycle_stage nullable (now computed from tools)
-            if 'lifecycle_stage' in interaction_columns:
-                # Check if column info has nullable property
-                col_info = [col for col in inspector.get_columns('tool_interactions') if col['name'] == 'lifecycle_stage']
-                if col_info and not col_info[0].get('nullable', False):
-                    logger.info("Migrating lifecycle_stage to nullable (now auto-computed)...")
-                    migrations_needed.append("ALTER TABLE tool_interactions ALTER COLUMN lifecycle_stage DROP NOT NULL")
+        # Add any columns from the spec table that the live schema is missing
+        for table_name, column_specs in SCHEMA_COLUMN_MIGRATIONS:
+            if table_name not in tables:
+                continue
+            existing_columns = {col['name'] for col in inspector.get_columns(table_name)}
+            for column_name, column_ddl in column_specs:
+                if column_name not in existing_columns:
+                    migrations_needed.append(f'ALTER TABLE {table_name} ADD COLUMN {column_name} {column_ddl}')
 
+        # Nov 13, 2025 Co-chairs meeting: Make lifecycle_stage nullable (now computed from tools)
+        try:
+            col_info = [col for col in inspector.get_columns('tool_interactions') if col['name'] == 'lifecycle_stage']
+            if col_info and not col_info[0].get('nullable', False):
+                logger.info("Migrating lifecycle_stage to nullable (now auto-computed)...")
+                migrations_needed.append("ALTER TABLE tool_interactions ALTER COLUMN lifecycle_stage DROP NOT NULL")
         except Exception as e:
             logger.warning(f"Could not check tool_interactions table: {e}")
-        
+
         # Execute migrations
         for migration in migrations_needed:
             logger.info(f"Executing migration: {migration}")
@@ -2241,181 +2425,280 @@ def migrate_database_schema():
                 db.session.rollback()
         else:
             logger.info("Database schema is up to date")
+
+        # Create any model-declared indexes that existing tables are missing
+        for table in db.metadata.sorted_tables:
+            if table.name not in tables:
+                continue
+            for index in table.indexes:
+                try:
+                    index.create(db.engine, checkfirst=True)
+                except Exception as e:
+                    logger.warning(f"Could not create index {index.name}: {e}")
             
     except Exception as e:
         logger.error(f"Error during schema migration: {e}")
         db.session.rollback()
 
+
+# Connection settings applied to SQLite databases before seeding
+SQLITE_SEED_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+)
+
+# MaLDReTH 1.0 reference data (simplified for reliability)
+SeedStage = namedtuple('SeedStage', 'description categories')
+
+MALDRETH_SEED_DATA = {
+    "CONCEPTUALISE": SeedStage(
+        description="To formulate the initial research idea or hypothesis, and define the scope of the research project and data requirements.",
+        categories={
+            "Mind mapping, concept mapping and knowledge modelling": ("FreeMind", "XMind", "Lucidchart", "Miro", "Roam Research"),
+            "Diagramming and flowchart": ("Draw.io", "Visio", "Creately"),
+            "Literature review": ("Zotero", "Mendeley")
+        }
+    ),
+    "PLAN": SeedStage(
+        description="To establish a structured strategic framework for management of the research project, outlining aims, objectives, methodologies, and resource allocation.",
+        categories={
+            "Data management planning (DMP)": ("DMPTool", "DMP Assistant", "DMPT"),
+            "Project planning": ("Gantt Project", "Microsoft Project", "Trello"),
+            "Research methodology": ("NVivo", "Atlas.ti")
+        }
+    ),
+    "FUND": SeedStage(
+        description="To identify and acquire financial resources to support the research project, including data collection, analysis, storage, and dissemination activities.",
+        categories={}  # No specific tools for funding stage
+    ),
+    "COLLECT": SeedStage(
+        description="To gather primary and secondary data according to the research methodology and ethical guidelines established during the planning phase.",
+        categories={
+            "Survey and questionnaire": ("SurveyMonkey", "Google Forms", "Qualtrics"),
+            "Data collection": ("ODK", "KoBoToolbox", "REDCap"),
+            "Field data collection": ("Epicollect5", "Survey123", "Fulcrum")
+        }
+    ),
+    "PROCESS": SeedStage(
+        description="To transform, clean, validate, and prepare raw data for analysis, ensuring data quality and consistency.",
+        categories={
+            "Electronic Laboratory Notebooks (ELNs)": ("LabArchives", "eLabJournal"),
+            "Scientific computing across all programming languages": ("Jupyter", "RStudio"),
+            "Data cleaning and transformation": ("OpenRefine", "Trifacta", "DataLadder")
+        }
+    ),
+    "ANALYSE": SeedStage(
+        description="To examine, interpret, and derive insights from processed data using appropriate analytical methods and tools.",
+        categories={
+            "Statistical analysis": ("R", "SPSS", "SAS"),
+            "Data visualization": ("Tableau", "D3.js"),
+            "Machine learning": ("Python scikit-learn", "TensorFlow")
+        }
+    ),
+    "STORE": SeedStage(
+        description="To securely store processed data and analysis results in appropriate formats and locations for future access and use.",
+        categories={
+            "Data repository": ("Figshare", "Zenodo"),
+            "Archive": ("DSpace",),
+            "Cloud storage": ("Google Drive", "Dropbox", "OneDrive")
+        }
+    ),
+    "PUBLISH": SeedStage(
+        description="To share research findings and datasets through appropriate channels, ensuring proper attribution and accessibility.",
+        categories={
+            "Academic publishing": ("LaTeX", "Overleaf", "Word"),
+            "Data publication": ("Dataverse", "Figshare"),
+            "Preprint servers": ("arXiv", "bioRxiv", "PeerJ Preprints")
+        }
+    ),
+    "PRESERVE": SeedStage(
+        description="To ensure long-term accessibility and integrity of research data and outputs through appropriate preservation strategies.",
+        categories={
+            "Digital preservation": ("LOCKSS", "Fedora", "DSpace", "Samvera"),
+            "Data repository": ("Institutional Repository", "Domain Repository", "Zenodo", "Figshare"),
+            "Archive": ("Digital preservation system",)
+        }
+    ),
+    "SHARE": SeedStage(
+        description="To make research data and findings available to other researchers and stakeholders through appropriate sharing mechanisms.",
+        categories={
+            "Data repository": ("GitHub", "Zenodo"),
+            "Electronic Laboratory Notebooks (ELNs)": ("LabArchives", "Benchling", "eLabNext", "Lab Archives"),
+            "Scientific computing across all programming languages": ("Jupyter", "Eclipse", "Jupyter")
+        }
+    ),
+    "ACCESS": SeedStage(
+        description="To provide controlled and documented access to research data for verification, reuse, and further research activities.",
+        categories={
+            "Data repository": ("DataCite", "CKAN"),
+            "Access control": ("Shibboleth", "OAuth"),
+            "Data discovery": ("DataCite", "Google Dataset Search", "CKAN")
+        }
+    ),
+    "TRANSFORM": SeedStage(
+        description="To convert and adapt research data and outputs into new formats, applications, or research contexts.",
+        categories={
+            "Data transformation": ("Apache Spark", "Talend", "Pentaho"),
+            "Electronic Laboratory Notebooks (ELNs)": ("LabArchives",),
+            "Format conversion": ("Pandoc", "ImageMagick", "FFmpeg")
+        }
+    )
+}
+
+
+# Maximum rows sent per bulk INSERT while seeding
+SEED_INSERT_BATCH_SIZE = 1000
+
+
+def category_key(stage_id, name):
+    """
+    Key a category by stage and normalized name.
+
+    Mirrors the unique (stage_id, lower(trim(name))) index clean_update creates on
+    tool_categories, so seeding never inserts a category that index would reject.
+    """
+    return stage_id, name.strip(' ').lower()
+
+
+def load_category_ids(connection):
+    """Map category_key -> id for all categories, keeping the oldest on duplicate keys."""
+    category_ids = {}
+    rows = connection.execute(
+        select(ToolCategory.id, ToolCategory.stage_id, ToolCategory.name).order_by(ToolCategory.id)
+    )
+    for category_id, stage_id, name in rows:
+        category_ids.setdefault(category_key(stage_id, name), category_id)
+    return category_ids
+
+
+def iter_seed_tool_rows(stage_ids, category_ids, active_tool_keys):
+    """
+    Yield insert mappings for seed tools that are not already active.
+
+    Args:
+        stage_ids: Stage name -> id
+        category_ids: category_key(stage_id, category name) -> id
+        active_tool_keys: Set of (name, category_id, stage_id) already present; updated in place
+    """
+    for stage_name, stage_info in MALDRETH_SEED_DATA.items():
+        stage_id = stage_ids[stage_name]
+        for category_name, tools in stage_info.categories.items():
+            category_id = category_ids[category_key(stage_id, category_name)]
+            for tool_name in tools:
+                tool_key = (tool_name, category_id, stage_id)
+                if tool_key in active_tool_keys:
+                    continue
+                active_tool_keys.add(tool_key)
+                yield {
+                    'name': tool_name,
+                    'stage_id': stage_id,
+                    'category_id': category_id,
+                    'description': f"{tool_name} - {category_name} tool for {stage_name}",
+                    'is_active': True,
+                    'auto_created': True,
+                    'import_source': "MaLDReTH 1.0 Initial Data"
+                }
+
+
 def init_database_with_maldreth_data():
     """Initialize database with MaLDReTH 1.0 data, preventing duplicates."""
     logger.info("Starting database initialization with duplicate prevention...")
     
-    # Check if data already exists (skip if already populated)
-    existing_stages = MaldrethStage.query.count()
-    existing_tools = ExemplarTool.query.filter_by(is_active=True).count()
-    
-    if existing_stages >= 12 and existing_tools > 50:
-        logger.info(f"Database already populated: {existing_stages} stages, {existing_tools} tools - skipping initialization")
+    # Check if data already exists (skip if already populated). Bounded probes for the
+    # 12th stage and 51st active tool avoid counting whole tables on every startup.
+    has_all_stages = db.session.query(MaldrethStage.id).offset(11).first() is not None
+    has_tools = (has_all_stages and
+                 db.session.query(ExemplarTool.id).filter_by(is_active=True).offset(50).first() is not None)
+
+    if has_all_stages and has_tools:
+        logger.info("Database already populated: at least 12 stages and 51 active tools - skipping initialization")
         return
     
     logger.info("Database needs initialization - proceeding with data setup...")
-    
-    # Deactivate any existing auto-created tools to prevent conflicts
-    auto_tools = ExemplarTool.query.filter_by(auto_created=True, is_active=True).all()
-    for tool in auto_tools:
-        tool.is_active = False
-    logger.info(f"Deactivated {len(auto_tools)} existing auto-created tools")
-    
-    # MaLDReTH 1.0 reference data (simplified for reliability)
-    maldreth_data = {
-        "CONCEPTUALISE": {
-            "description": "To formulate the initial research idea or hypothesis, and define the scope of the research project and data requirements.",
-            "categories": {
-                "Mind mapping, concept mapping and knowledge modelling": ["FreeMind", "XMind", "Lucidchart", "Miro", "Roam Research"],
-                "Diagramming and flowchart": ["Draw.io", "Visio", "Creately"],
-                "Literature review": ["Zotero", "Mendeley"]
-            }
-        },
-        "PLAN": {
-            "description": "To establish a structured strategic framework for management of the research project, outlining aims, objectives, methodologies, and resource allocation.",
-            "categories": {
-                "Data management planning (DMP)": ["DMPTool", "DMP Assistant", "DMPT"],
-                "Project planning": ["Gantt Project", "Microsoft Project", "Trello"],
-                "Research methodology": ["NVivo", "Atlas.ti"]
-            }
-        },
-        "FUND": {
-            "description": "To identify and acquire financial resources to support the research project, including data collection, analysis, storage, and dissemination activities.",
-            "categories": {}  # No specific tools for funding stage
-        },
-        "COLLECT": {
-            "description": "To gather primary and secondary data according to the research methodology and ethical guidelines established during the planning phase.",
-            "categories": {
-                "Survey and questionnaire": ["SurveyMonkey", "Google Forms", "Qualtrics"],
-                "Data collection": ["ODK", "KoBoToolbox", "REDCap"],
-                "Field data collection": ["Epicollect5", "Survey123", "Fulcrum"]
-            }
-        },
-        "PROCESS": {
-            "description": "To transform, clean, validate, and prepare raw data for analysis, ensuring data quality and consistency.",
-            "categories": {
-                "Electronic Laboratory Notebooks (ELNs)": ["LabArchives", "eLabJournal"],
-                "Scientific computing across all programming languages": ["Jupyter", "RStudio"],
-                "Data cleaning and transformation": ["OpenRefine", "Trifacta", "DataLadder"]
-            }
-        },
-        "ANALYSE": {
-            "description": "To examine, interpret, and derive insights from processed data using appropriate analytical methods and tools.",
-            "categories": {
-                "Statistical analysis": ["R", "SPSS", "SAS"],
-                "Data visualization": ["Tableau", "D3.js"],
-                "Machine learning": ["Python scikit-learn", "TensorFlow"]
-            }
-        },
-        "STORE": {
-            "description": "To securely store processed data and analysis results in appropriate formats and locations for future access and use.",
-            "categories": {
-                "Data repository": ["Figshare", "Zenodo"],
-                "Archive": ["DSpace"],
-                "Cloud storage": ["Google Drive", "Dropbox", "OneDrive"]
-            }
-        },
-        "PUBLISH": {
-            "description": "To share research findings and datasets through appropriate channels, ensuring proper attribution and accessibility.",
-            "categories": {
-                "Academic publishing": ["LaTeX", "Overleaf", "Word"],
-                "Data publication": ["Dataverse", "Figshare"],
-                "Preprint servers": ["arXiv", "bioRxiv", "PeerJ Preprints"]
-            }
-        },
-        "PRESERVE": {
-            "description": "To ensure long-term accessibility and integrity of research data and outputs through appropriate preservation strategies.",
-            "categories": {
-                "Digital preservation": ["LOCKSS", "Fedora", "DSpace", "Samvera"],
-                "Data repository": ["Institutional Repository", "Domain Repository", "Zenodo", "Figshare"],
-                "Archive": ["Digital preservation system"]
-            }
-        },
-        "SHARE": {
-            "description": "To make research data and findings available to other researchers and stakeholders through appropriate sharing mechanisms.",
-            "categories": {
-                "Data repository": ["GitHub", "Zenodo"],
-                "Electronic Laboratory Notebooks (ELNs)": ["LabArchives", "Benchling", "eLabNext", "Lab Archives"],
-                "Scientific computing across all programming languages": ["Jupyter", "Eclipse", "Jupyter"]
-            }
-        },
-        "ACCESS": {
-            "description": "To provide controlled and documented access to research data for verification, reuse, and further research activities.",
-            "categories": {
-                "Data repository": ["DataCite", "CKAN"],
-                "Access control": ["Shibboleth", "OAuth"],
-                "Data discovery": ["DataCite", "Google Dataset Search", "CKAN"]
+
+    if db.engine.dialect.name == 'sqlite':
+        # Must run before the first write: journal_mode cannot change inside a transaction.
+        # WAL with synchronous=NORMAL is still crash-safe and avoids an fsync per commit.
+        for pragma in SQLITE_SEED_PRAGMAS:
+            db.session.execute(db.text(pragma))
+
+    try:
+        # Deactivate any existing auto-created tools to prevent conflicts (single UPDATE,
+        # so no dirty objects are left behind to be autoflushed by the lookups below)
+        deactivated_count = ExemplarTool.query.filter_by(auto_created=True, is_active=True).update(
+            {ExemplarTool.is_active: False}, synchronize_session=False
+        )
+        logger.info(f"Deactivated {deactivated_count} existing auto-created tools")
+
+        # Seed rows are written with Core statements on the session's transactional
+        # connection, fetched once: the ORM unit of work adds nothing for plain dict
+        # rows that are never loaded back as objects.
+        connection = db.session.connection()
+        stage_id_query = select(MaldrethStage.name, MaldrethStage.id)
+
+        # Preload existing rows once instead of querying per stage, category and tool
+        stage_ids = dict(connection.execute(stage_id_query).all())
+        category_ids = load_category_ids(connection)
+        active_tool_keys = set(connection.execute(
+            select(ExemplarTool.name, ExemplarTool.category_id, ExemplarTool.stage_id)
+            .where(ExemplarTool.is_active.is_(True))
+        ).all())
+
+        # Insert all missing stages in one batch, then resolve their IDs with one SELECT.
+        # IDs stay database-assigned: a partially seeded database may already use any of them.
+        stage_rows = [
+            {
+                'name': stage_name,
+                'description': stage_info.description,
+                'position': position
             }
-        },
-        "TRANSFORM": {
-            "description": "To convert and adapt research data and outputs into new formats, applications, or research contexts.",
-            "categories": {
-                "Data transformation": ["Apache Spark", "Talend", "Pentaho"],
-                "Electronic Laboratory Notebooks (ELNs)": ["LabArchives"],
-                "Format conversion": ["Pandoc", "ImageMagick", "FFmpeg"]
+            for position, (stage_name, stage_info) in enumerate(MALDRETH_SEED_DATA.items())
+            if stage_name not in stage_ids
+        ]
+        if stage_rows:
+            connection.execute(MaldrethStage.__table__.insert(), stage_rows)
+            stage_ids = dict(connection.execute(stage_id_query).all())
+
+        # Insert all missing categories in one batch, then resolve their IDs with one SELECT
+        category_rows = [
+            {
+                'name': category_name,
+                'stage_id': stage_ids[stage_name],
+                'description': f"Category for {category_name} tools in {stage_name} stage"
             }
-        }
-    }
-    
-    # Create or update stages and categories
-    for position, (stage_name, stage_info) in enumerate(maldreth_data.items()):
-        # Get or create stage
-        stage = MaldrethStage.query.filter_by(name=stage_name).first()
-        if not stage:
-            stage = MaldrethStage(
-                name=stage_name,
-                description=stage_info["description"],
-                position=position
-            )
-            db.session.add(stage)
-            db.session.flush()  # Get the stage ID
-        
-        # Create categories and tools for this stage
-        for category_name, tools in stage_info["categories"].items():
-            # Get or create category
-            category = ToolCategory.query.filter_by(
-                name=category_name, 
-                stage_id=stage.id
-            ).first()
-            
-            if not category:
-                category = ToolCategory(
-                    name=category_name,
-                    stage_id=stage.id,
-                    description=f"Category for {category_name} tools in {stage_name} stage"
-                )
-                db.session.add(category)
-                db.session.flush()  # Get the category ID
-            
-            # Add tools to this category (prevent duplicates)
-            for tool_name in tools:
-                # Check if tool already exists in this category
-                existing_tool = ExemplarTool.query.filter_by(
-                    name=tool_name,
-                    category_id=category.id,
-                    stage_id=stage.id,
-                    is_active=True
-                ).first()
-                
-                if not existing_tool:
-                    tool = ExemplarTool(
-                        name=tool_name,
-                        stage_id=stage.id,
-                        category_id=category.id,
-                        description=f"{tool_name} - {category_name} tool for {stage_name}",
-                        is_active=True,
-                        auto_created=True,
-                        import_source="MaLDReTH 1.0 Initial Data"
-                    )
-                    db.session.add(tool)
-    
-    # Commit all changes
-    db.session.commit()
+            for stage_name, stage_info in MALDRETH_SEED_DATA.items()
+            for category_name in stage_info.categories
+            if category_key(stage_ids[stage_name], category_name) not in category_ids
+        ]
+        if category_rows:
+            connection.execute(ToolCategory.__table__.insert(), category_rows)
+            category_ids = load_category_ids(connection)
+
+        # Stream missing tools into bounded insert batches (prevent duplicates)
+        tool_rows = iter_seed_tool_rows(stage_ids, category_ids, active_tool_keys)
+        for batch in chunked(tool_rows, SEED_INSERT_BATCH_SIZE):
+            connection.execute(ExemplarTool.__table__.insert(), batch)
+
+        # Commit all changes in one transaction
+        db.session.commit()
+    except Exception as e:
+        # Leave the database untouched rather than half-seeded
+        db.session.rollback()
+        logger.error(f"Database initialization failed, changes rolled back: {e}")
+        raise
+
+    # Refresh planner statistics for the freshly loaded tables
+    try:
+        if db.engine.dialect.name == 'postgresql':
+            for model in (MaldrethStage, ToolCategory, ExemplarTool):
+                db.session.execute(db.text(f"ANALYZE {model.__tablename__}"))
+        elif db.engine.dialect.name == 'sqlite':
+            db.session.execute(db.text("ANALYZE"))
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"Could not analyze seeded tables: {e}")
     
     # Final statistics
     total_stages = MaldrethStage.query.count()
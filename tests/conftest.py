@@ -0,0 +1,6 @@
+"""Shared pytest configuration for the PRISM test suite."""
+import os
+import sys
+
+# Make the application modules at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -0,0 +1,13 @@
+from streamlined_app import TOOL_NAME_DELETE_CHARS, normalize_tool_name
+
+
+def test_normalize_tool_name_removes_surrounding_tabs_and_line_breaks():
+    """Test tabs and line breaks are removed the same way the SQL expression removes them."""
+    assert normalize_tool_name('\tGitHub\t') == 'github'
+    assert normalize_tool_name('GitHub\r\n') == 'github'
+    assert {'\t', '\r', '\n'} <= set(TOOL_NAME_DELETE_CHARS)
+
+
+def test_normalize_tool_name_removes_punctuation():
+    """Test punctuation and spaces are ignored when comparing tool names."""
+    assert normalize_tool_name(' Git-Hub (v2) ') == 'githubv2'
@@ -0,0 +1,18 @@
+"""Tests for form input validation helpers in streamlined_app."""
+from streamlined_app import validate_email_address
+
+
+def test_accepts_valid_email():
+    assert validate_email_address('a@b.co', 100) is None
+
+
+def test_accepts_empty_email():
+    assert validate_email_address('', 100) is None
+
+
+def test_rejects_email_with_trailing_newline():
+    assert validate_email_address('a@b.co\n', 100) == 'Please enter a valid email address.'
+
+
+def test_rejects_overlong_email():
+    assert validate_email_address('a' * 96 + '@b.co', 100) == 'Email address must be 100 characters or fewer.'